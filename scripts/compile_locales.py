@@ -0,0 +1,28 @@
+"""
+Compile the YAML locale files into flattened JSON lookup tables.
+
+The Streamlit app loads ``locales/<language>.json`` when it is at least as
+recent as the matching ``.yml`` file, which avoids parsing YAML on the
+interactive path. Run this after editing any locale file (``make locales``).
+"""
+
+import json
+
+import yaml
+
+from pain_narratives.ui.utils.localization import LOCALES_PATH, _flatten_language_data
+
+
+def compile_locales() -> None:
+    """Write a flattened ``.json`` file next to every ``.yml`` locale."""
+    for yml_path in sorted(LOCALES_PATH.glob("*.yml")):
+        with open(yml_path, "r", encoding="utf-8") as f:
+            flat = _flatten_language_data(yaml.safe_load(f))
+
+        json_path = yml_path.with_suffix(".json")
+        json_path.write_text(json.dumps(flat, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        print(f"✅ {yml_path.name} -> {json_path.name} ({len(flat)} keys)")
+
+
+if __name__ == "__main__":
+    compile_locales()
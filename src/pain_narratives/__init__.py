@@ -1,5 +1,35 @@
 """Pain Narratives Analysis Package."""
 
+import importlib
+from typing import Any, List
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
+
+# Public names re-exported lazily (PEP 562) so ``import pain_narratives`` stays
+# cheap; each submodule is imported on first attribute access only.
+_LAZY = {
+    "get_settings": "pain_narratives.config.settings",
+    "DatabaseManager": "pain_narratives.core.database",
+    "get_database_manager": "pain_narratives.core.database",
+    "OpenAIClient": "pain_narratives.core.openai_client",
+    "get_openai_client": "pain_narratives.core.openai_client",
+    "file_to_markdown": "pain_narratives.utils.file_utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
@@ -7,21 +7,24 @@ Prompts are loaded from default_prompts.yaml for easy maintenance and updates.
 
 import logging
 from functools import lru_cache
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from importlib.resources import files
+from importlib.resources.abc import Traversable
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
-# Path to the default prompts YAML file
-PROMPTS_CONFIG_FILE = Path(__file__).parent / "default_prompts.yaml"
+# Path to the default prompts YAML file. Resolved as a package resource so it
+# can also be read when the package is imported from a zip archive.
+PROMPTS_CONFIG_FILE = files(__package__) / "default_prompts.yaml"
 
 # Map of prompt-version name -> YAML file. "original" is what was used in the
 # published GPT-5 baseline; "simplified_v1" is the revision-experiment variant.
-PROMPT_VERSION_FILES: Dict[str, Path] = {
+PROMPT_VERSION_FILES: Dict[str, Traversable] = {
     "original": PROMPTS_CONFIG_FILE,
-    "simplified_v1": Path(__file__).parent / "simplified_v1_prompts.yaml",
+    "simplified_v1": files(__package__) / "simplified_v1_prompts.yaml",
 }
 
 
@@ -37,7 +40,7 @@ def load_prompts_version(version: str = "original") -> Dict[str, Any]:
     if version not in PROMPT_VERSION_FILES:
         raise ValueError(f"Unknown prompt version {version!r}; known versions: {list(PROMPT_VERSION_FILES)}")
     path = PROMPT_VERSION_FILES[version]
-    with open(path, "r", encoding="utf-8") as f:
+    with path.open("r", encoding="utf-8") as f:
         config = yaml.safe_load(f)
     logger.info(f"Loaded prompts version {version!r} from {path}")
     return config
@@ -131,6 +134,50 @@ def get_default_prompt(version: str = "original") -> str:
     return "\n\n".join(parts)
 
 
+@lru_cache(maxsize=64)
+def _prompt_parts(template: str) -> Optional[Tuple[str, str]]:
+    """Split a prompt template into the literal text around its ``{narrative}`` field.
+
+    Escaped braces are unescaped in the returned parts.  Returns ``None`` when the
+    template is not a plain single ``{narrative}`` substitution (extra fields,
+    format specs, conversions or malformed braces), so callers can fall back to
+    :meth:`str.format` and get its usual behaviour and errors.
+    """
+    prefix: List[str] = []
+    suffix: List[str] = []
+    seen_narrative = False
+    try:
+        for literal, field, format_spec, conversion in Formatter().parse(template):
+            (suffix if seen_narrative else prefix).append(literal)
+            if field is None:
+                continue
+            if field != "narrative" or format_spec or conversion or seen_narrative:
+                return None
+            seen_narrative = True
+    except ValueError:
+        return None
+    if not seen_narrative:
+        return None
+    return "".join(prefix), "".join(suffix)
+
+
+def format_prompt(template: str, narrative: Any) -> str:
+    """Equivalent to ``template.format(narrative=narrative)``, without re-parsing the template.
+
+    Args:
+        template: Prompt template containing a ``{narrative}`` placeholder.
+        narrative: Narrative text to substitute.
+
+    Returns:
+        The formatted prompt.
+    """
+    parts = _prompt_parts(template)
+    if parts is None:
+        return template.format(narrative=narrative)
+    prefix, suffix = parts
+    return prefix + str(narrative) + suffix
+
+
 def get_questionnaire_prompts(version: str = "original") -> Dict[str, Dict[str, str]]:
     """Return all questionnaire prompts (PCS, BPI-IS, TSK-11SV) for the requested
     prompt version, as a dict mapping type → {system_role, instructions}."""
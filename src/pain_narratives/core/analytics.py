@@ -1,13 +1,15 @@
 """Analytics and evaluation functions for pain narratives."""
 
+from __future__ import annotations
+
 import json
 import logging
-from typing import Any, Dict, Literal, Optional
-
-import pandas as pd
-from sklearn.metrics import cohen_kappa_score, mean_squared_error
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
 
-from .openai_client import remove_unicode_chars
+# pandas, scikit-learn and the OpenAI client are imported inside the functions
+# that need them; together they dominate the import time of this module.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def convert_string_to_json(input_string: str) -> Optional[Dict[str, Any]]:
@@ -48,6 +50,10 @@ def parse_answers(
     Returns:
         True if parsing successful, False otherwise
     """
+    import pandas as pd
+
+    from .openai_client import remove_unicode_chars
+
     response = remove_unicode_chars(response)
     try:
         message_content = response["choices"][0]["message"]["content"]
@@ -80,6 +86,8 @@ def parse_answers(
 
 def calculate_mse(values_original: pd.Series, values_new: pd.Series) -> float:
     """Calculate the Mean Squared Error between two series of annotations."""
+    from sklearn.metrics import mean_squared_error
+
     mse = mean_squared_error(values_original, values_new)
     return float(mse)
 
@@ -90,11 +98,15 @@ def calculate_kappa(
     weights: Optional[Literal["linear", "quadratic"]] = None,
 ) -> float:
     """Calculate Cohen's Kappa between two series of annotations."""
+    from sklearn.metrics import cohen_kappa_score
+
     return float(cohen_kappa_score(values_original, values_new, weights=weights))
 
 
 def calculate_rmse(values_original: pd.Series, values_new: pd.Series) -> float:
     """Calculate the Root Mean Squared Error between two series of annotations."""
+    from sklearn.metrics import mean_squared_error
+
     rmse = mean_squared_error(values_original, values_new, squared=False)
     return float(rmse)
 
@@ -28,6 +28,7 @@ from pain_narratives.db.models_sqlmodel import (
     User,
     UserPrompt,
 )
+from pain_narratives.utils.caching import resource_cache
 
 
 class DatabaseManager:
@@ -793,13 +794,7 @@ class DatabaseManager:
             }
 
 
-# Singleton database manager instance
-_db_manager: Optional[DatabaseManager] = None
-
-
+@resource_cache
 def get_database_manager() -> DatabaseManager:
     """Get the singleton database manager instance."""
-    global _db_manager
-    if _db_manager is None:
-        _db_manager = DatabaseManager()
-    return _db_manager
+    return DatabaseManager()
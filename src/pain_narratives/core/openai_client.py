@@ -1,14 +1,18 @@
 """OpenAI API client and utilities - Fixed version with comprehensive debugging."""
 
-import logging
-from typing import Any, Optional
+from __future__ import annotations
 
-from openai import OpenAI
+import logging
+from typing import TYPE_CHECKING, Any, Optional
 
 from pain_narratives.core.database import get_database_manager
+from pain_narratives.utils.caching import resource_cache
 
 from ..config.settings import get_settings
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,10 @@ class OpenAIClient:
         """Get or create OpenAI client."""
         if self._client is None:
             logger.info("Creating new OpenAI client instance...")
+            # Imported on first use: the SDK and its httpx/pydantic models are
+            # costly to load and most imports of this module never call the API.
+            from openai import OpenAI
+
             try:
                 self._client = OpenAI(api_key=self._api_key, organization=self._org_id, timeout=60)
                 logger.info("OpenAI client created successfully")
@@ -292,13 +300,7 @@ def remove_unicode_chars(data: dict[str, Any]) -> dict[str, Any]:
     return new_dict
 
 
-# Global OpenAI client instance
-_openai_client: Optional[OpenAIClient] = None
-
-
+@resource_cache
 def get_openai_client() -> OpenAIClient:
     """Get the global OpenAI client instance."""
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = OpenAIClient()
-    return _openai_client
+    return OpenAIClient()
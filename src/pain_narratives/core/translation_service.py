@@ -27,6 +27,7 @@ import logging
 from typing import Any, Dict, Optional
 
 from pain_narratives.core.openai_client import OpenAIClient
+from pain_narratives.utils.caching import resource_cache
 
 logger = logging.getLogger(__name__)
 
@@ -206,3 +207,9 @@ Return the translated explanations in the same JSON format, with the same keys b
 
         logger.info(f"Added {target_language} translation to result")
         return result_json
+
+
+@resource_cache
+def get_translation_service() -> TranslationService:
+    """Get the shared translation service instance, built once instead of per render."""
+    return TranslationService()
@@ -2,6 +2,17 @@
 UI components for the pain narratives application.
 """
 
-from .app import PainNarrativesApp, main
+from typing import Any
 
 __all__ = ["main", "PainNarrativesApp"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the app pulls in every component, so defer it until the entry
+    # point is actually requested (PEP 562).  Importing e.g.
+    # ``pain_narratives.ui.components.prompt_manager`` no longer loads it.
+    if name in __all__:
+        from . import app
+
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
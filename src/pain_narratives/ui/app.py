@@ -215,10 +215,6 @@ class PainNarrativesApp:
                 except Exception as e:
                     logger.error(f"Failed to update user language preference: {e}")
 
-            # Clear both caches when language changes
-            st.cache_data.clear()
-            if hasattr(st.session_state, "current_localization_language"):
-                del st.session_state.current_localization_language
             st.rerun()
 
         # Update session state
@@ -264,10 +260,6 @@ class PainNarrativesApp:
                         # Load user's preferred language
                         if "preferred_language" in user:
                             st.session_state.language = user["preferred_language"]
-                            # Clear caches to refresh with user's language
-                            st.cache_data.clear()
-                            if hasattr(st.session_state, "current_localization_language"):
-                                del st.session_state.current_localization_language
                         st.sidebar.success(t("auth.welcome_user").format(username=user["username"]))
                         logger.info("User %s logged in successfully", username)
                         st.rerun()  # Refresh the page to show authenticated state
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Mapping, Optional, Tuple
 
 import streamlit as st
 
-from pain_narratives.ui.utils.localization import get_translator
+from pain_narratives.ui.utils.localization import get_translator, language_cache
 
 __all__ = ["render_assessment_feedback_form"]
 
-LIKERT_OPTIONS: List[tuple[str, str]] = [
+LIKERT_OPTIONS: Final[Tuple[Tuple[str, str], ...]] = (
     ("Strongly Disagree", "strongly_disagree"),
     ("Disagree", "disagree"),
     ("Somewhat Disagree", "somewhat_disagree"),
@@ -19,21 +20,25 @@ LIKERT_OPTIONS: List[tuple[str, str]] = [
     ("Somewhat Agree", "somewhat_agree"),
     ("Agree", "agree"),
     ("Strongly Agree", "strongly_agree"),
-]
+)
 
-_VALUE_TO_INDEX = {value: idx for idx, (value, _) in enumerate(LIKERT_OPTIONS)}
+_VALUE_TO_INDEX: Final[Mapping[str, int]] = MappingProxyType(
+    {value: idx for idx, (value, _) in enumerate(LIKERT_OPTIONS)}
+)
+_DEFAULT_INDEX: Final = _VALUE_TO_INDEX["Neither Agree Nor Disagree"]
 
 
-def _format_option(value: str) -> str:
-    t = get_translator(st.session_state.get("language", "en"))
-    key = dict(LIKERT_OPTIONS)[value]
-    return t(f"assessment_feedback.options.{key}")
+@language_cache
+def _label_map_for(language: str) -> Dict[str, str]:
+    """Return the localized Likert labels for ``language``, keyed by option value."""
+    t = get_translator(language)
+    return {value: t(f"assessment_feedback.options.{key}") for value, key in LIKERT_OPTIONS}
 
 
 def _option_index(current: Optional[str]) -> int:
     if current is None:
-        return 3  # Default to "Neither Agree Nor Disagree"
-    return _VALUE_TO_INDEX.get(current, 3)
+        return _DEFAULT_INDEX
+    return _VALUE_TO_INDEX.get(current, _DEFAULT_INDEX)
 
 
 def _dimension_streamlit_key(dimension: Dict[str, Any], experiment_id: int, suffix: str) -> str:
@@ -140,7 +145,7 @@ def render_assessment_feedback_form(
         return  # Exit early if feedback already exists
 
     likert_values = [value for value, _ in LIKERT_OPTIONS]
-    label_map = {value: _format_option(value) for value in likert_values}
+    label_map = _label_map_for(st.session_state.get("language", "en"))
     placeholder = t("assessment_feedback.select_placeholder")
 
     def select_question(
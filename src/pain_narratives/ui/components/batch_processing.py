@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 import pandas as pd
 import streamlit as st
 
+from pain_narratives.config.prompts import format_prompt
+
 
 def run_batch_evaluation(
     df: "pd.DataFrame",
@@ -34,7 +36,7 @@ def run_batch_evaluation(
     for idx, (i, row) in enumerate(df.iterrows()):
         status_text.text(f"Processing narrative {idx + 1}/{len(df)}")
         try:
-            formatted_prompt = prompt.format(narrative=row["narrative"])
+            formatted_prompt = format_prompt(prompt, row["narrative"])
             response = openai_client.create_completion(
                 messages=[{"role": "user", "content": formatted_prompt}],
                 model=config["model"],
@@ -7,6 +7,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from pain_narratives.core.translation_service import get_translation_service
 from pain_narratives.ui.utils import get_translator
 
 
@@ -27,9 +28,7 @@ def display_score_metrics(
     # Handle multilingual result structure
     evaluation_result = result
     if isinstance(result, dict) and any(key in ["en", "es", "fr", "de"] for key in result.keys()):
-        from pain_narratives.core.translation_service import TranslationService
-
-        translation_service = TranslationService()
+        translation_service = get_translation_service()
         current_language = st.session_state.get("language", "en")
         evaluation_result = translation_service.get_available_translation(result, current_language)
 
@@ -293,9 +292,7 @@ def display_evaluation_details(
 
             # Get result in user's preferred language if it's a multilingual structure
             if isinstance(result, dict) and any(key in ["en", "es", "fr", "de"] for key in result.keys()):
-                from pain_narratives.core.translation_service import TranslationService
-
-                translation_service = TranslationService()
+                translation_service = get_translation_service()
                 current_language = st.session_state.get("language", "en")
                 result = translation_service.get_available_translation(result, current_language)
 
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, Any, Dict, List
 import streamlit as st
 from pydantic import BaseModel
 
+from pain_narratives.config.prompts import format_prompt
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -46,7 +48,7 @@ class NarrativeEvaluator:
 
         try:
             logger.info("Formatting prompt with narrative...")
-            formatted_prompt = prompt.format(narrative=narrative_text)
+            formatted_prompt = format_prompt(prompt, narrative_text)
             logger.info("Formatted prompt length: %d", len(formatted_prompt))
             logger.info("Formatted prompt preview: %s...", formatted_prompt[:200])
 
@@ -224,7 +226,7 @@ class NarrativeEvaluator:
 
         for i in range(num_evaluations):
             try:
-                formatted_prompt = prompt.format(narrative=narrative_text)
+                formatted_prompt = format_prompt(prompt, narrative_text)
                 response = openai_client.create_completion(
                     messages=[{"role": "user", "content": formatted_prompt}],
                     model=config["model"],
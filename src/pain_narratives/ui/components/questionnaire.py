@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import streamlit as st
 
 from pain_narratives.core.openai_client import OpenAIClient
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 ##########################################################################
@@ -696,6 +699,21 @@ def calculate_tsk_11sv_total_score(result: Dict[str, Any]) -> int:
     return sum(r["value"] for r in responses)
 
 
+def _score_chart_table(
+    ordered_scores: List[int], counts: Dict[int, int], scale_labels: Dict[int, str] | None = None
+) -> pa.Table:
+    """Build the columnar chart data for a score distribution as an Arrow table."""
+    import pyarrow as pa
+
+    columns: Dict[str, List[Any]] = {
+        "Score": ordered_scores,
+        "Count": [counts.get(score, 0) for score in ordered_scores],
+    }
+    if scale_labels is not None:
+        columns["Scale"] = [scale_labels[score] for score in ordered_scores]
+    return pa.Table.from_pydict(columns)
+
+
 def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type: str, translator):
     """
     Display a standardized score distribution chart for any questionnaire type.
@@ -706,7 +724,6 @@ def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type:
         translator: Translation function for localized labels
     """
     import altair as alt
-    import pandas as pd
     import streamlit as st
 
     if not counts or all(count == 0 for count in counts.values()):
@@ -719,10 +736,7 @@ def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type:
     if questionnaire_type == "PCS":
         # PCS: Use defined order from PCS_SCORE_LABELS (0→1→2→3→4)
         ordered_scores = sorted(PCS_SCORE_LABELS.keys())
-        chart_data = []
-        for score in ordered_scores:
-            chart_data.append({"Score": score, "Count": counts.get(score, 0), "Scale": PCS_SCORE_LABELS[score]})
-        df = pd.DataFrame(chart_data)
+        df = _score_chart_table(ordered_scores, counts, PCS_SCORE_LABELS)
         chart = (
             alt.Chart(df)
             .mark_bar()
@@ -730,7 +744,7 @@ def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type:
                 x=alt.X(
                     "Scale:N",
                     axis=alt.Axis(labelAngle=-45, title="Scale"),
-                    sort=None,  # Preserve DataFrame order
+                    sort=None,  # Preserve table order
                 ),
                 y=alt.Y("Count:Q", axis=alt.Axis(title="Count")),
             )
@@ -738,10 +752,7 @@ def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type:
     elif questionnaire_type == "BPI-IS":
         # BPI-IS: Numeric 0-10 scale, displayed normally (not rotated)
         ordered_scores = list(range(11))  # 0 through 10
-        chart_data = []
-        for score in ordered_scores:
-            chart_data.append({"Score": score, "Count": counts.get(score, 0)})
-        df = pd.DataFrame(chart_data)
+        df = _score_chart_table(ordered_scores, counts)
         chart = (
             alt.Chart(df)
             .mark_bar()
@@ -757,10 +768,7 @@ def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type:
     elif questionnaire_type == "TSK-11SV":
         # TSK-11SV: Use defined order from TSK_11SV_SCALE_LABELS (1→2→3→4)
         ordered_scores = sorted(TSK_11SV_SCALE_LABELS.keys())
-        chart_data = []
-        for score in ordered_scores:
-            chart_data.append({"Score": score, "Count": counts.get(score, 0), "Scale": TSK_11SV_SCALE_LABELS[score]})
-        df = pd.DataFrame(chart_data)
+        df = _score_chart_table(ordered_scores, counts, TSK_11SV_SCALE_LABELS)
         chart = (
             alt.Chart(df)
             .mark_bar()
@@ -768,7 +776,7 @@ def display_score_distribution_chart(counts: Dict[int, int], questionnaire_type:
                 x=alt.X(
                     "Scale:N",
                     axis=alt.Axis(labelAngle=-45, title="Scale"),
-                    sort=None,  # Preserve DataFrame order
+                    sort=None,  # Preserve table order
                 ),
                 y=alt.Y("Count:Q", axis=alt.Axis(title="Count")),
             )
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Optional, Tuple
 
 import streamlit as st
 
-from pain_narratives.ui.utils.localization import get_translator
+from pain_narratives.ui.utils.localization import get_translator, language_cache
 
 __all__ = ["render_questionnaire_feedback_form"]
 
-LIKERT_OPTIONS: List[tuple[str, str]] = [
+LIKERT_OPTIONS: Final[Tuple[Tuple[str, str], ...]] = (
     ("Strongly Disagree", "strongly_disagree"),
     ("Disagree", "disagree"),
     ("Somewhat Disagree", "somewhat_disagree"),
@@ -18,21 +19,37 @@ LIKERT_OPTIONS: List[tuple[str, str]] = [
     ("Somewhat Agree", "somewhat_agree"),
     ("Agree", "agree"),
     ("Strongly Agree", "strongly_agree"),
-]
+)
 
-_VALUE_TO_INDEX = {value: idx for idx, (value, _) in enumerate(LIKERT_OPTIONS)}
+_VALUE_TO_INDEX: Final[Mapping[str, int]] = MappingProxyType(
+    {value: idx for idx, (value, _) in enumerate(LIKERT_OPTIONS)}
+)
+_DEFAULT_INDEX: Final = _VALUE_TO_INDEX["Neither Agree Nor Disagree"]
 
 
-def _format_option(value: str) -> str:
-    t = get_translator(st.session_state.get("language", "en"))
-    key = dict(LIKERT_OPTIONS)[value]
-    return t(f"questionnaire_feedback.options.{key}")
+@language_cache
+def _label_map_for(language: str) -> Dict[str, str]:
+    """Return the localized Likert labels for ``language``, keyed by option value."""
+    t = get_translator(language)
+    return {value: t(f"questionnaire_feedback.options.{key}") for value, key in LIKERT_OPTIONS}
 
 
 def _option_index(current: Optional[str]) -> int:
     if current is None:
-        return 3  # Default to "Neither Agree Nor Disagree"
-    return _VALUE_TO_INDEX.get(current, 3)
+        return _DEFAULT_INDEX
+    return _VALUE_TO_INDEX.get(current, _DEFAULT_INDEX)
+
+
+def _feedback_cache_key(questionnaire_id: int, user_id: Optional[int]) -> str:
+    return f"_fb_cache_{questionnaire_id}_{user_id}"
+
+
+def _cached_existing_feedback(db_manager: Any, questionnaire_id: int, user_id: Optional[int]) -> Any:
+    """Return stored feedback, querying the database only once per session."""
+    cache_key = _feedback_cache_key(questionnaire_id, user_id)
+    if cache_key not in st.session_state:
+        st.session_state[cache_key] = db_manager.get_questionnaire_feedback(questionnaire_id, user_id)
+    return st.session_state[cache_key]
 
 
 def render_questionnaire_feedback_form(
@@ -66,8 +83,8 @@ def render_questionnaire_feedback_form(
     feedback_completion_key = f"questionnaire_feedback_completed_{questionnaire_id}_{user.get('id')}"
     recently_completed = st.session_state.get(feedback_completion_key, False)
 
-    # Check database for existing feedback
-    existing = db_manager.get_questionnaire_feedback(questionnaire_id, user.get("id"))
+    # Check database for existing feedback (memoized for the session)
+    existing = _cached_existing_feedback(db_manager, questionnaire_id, user.get("id"))
     feedback_already_exists = existing is not None or recently_completed
 
     if feedback_already_exists:
@@ -94,7 +111,7 @@ def render_questionnaire_feedback_form(
         return  # Exit early if feedback already exists
 
     likert_values = [value for value, _ in LIKERT_OPTIONS]
-    label_map = {value: _format_option(value) for value in likert_values}
+    label_map = _label_map_for(st.session_state.get("language", "en"))
     placeholder = t("questionnaire_feedback.select_placeholder")
 
     def select_question(
@@ -157,6 +174,7 @@ def render_questionnaire_feedback_form(
 
     try:
         db_manager.save_questionnaire_feedback(payload)
+        st.session_state.pop(_feedback_cache_key(questionnaire_id, user.get("id")), None)
 
         # Mark feedback as completed in session state
         st.session_state[feedback_completion_key] = True
@@ -1,10 +1,19 @@
 """UI display components for pain narratives Streamlit app."""
 
-from typing import Any, Callable, Dict, List, Optional
+import io
+from collections import defaultdict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional
 
-import pandas as pd
+import pyarrow.csv as pa_csv
 import streamlit as st
 
+from pain_narratives.core.translation_service import get_translation_service
+from pain_narratives.ui.utils.data_handling import columns_to_arrow_table
+
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
 
 def display_evaluation_results(result: Dict[str, Any], dimension_labels: Optional[Dict[str, str]] = None) -> None:
     """
@@ -21,9 +30,7 @@ def display_evaluation_results(result: Dict[str, Any], dimension_labels: Optiona
 
     # Check if this is a multilingual result structure
     if isinstance(evaluation_result, dict) and any(key in ["en", "es", "fr", "de"] for key in evaluation_result.keys()):
-        from pain_narratives.core.translation_service import TranslationService
-
-        translation_service = TranslationService()
+        translation_service = get_translation_service()
         current_language = st.session_state.get("language", "en")
         evaluation_result = translation_service.get_available_translation(evaluation_result, current_language)
 
@@ -65,56 +72,54 @@ def display_batch_results(results: List[Dict[str, Any]], dimension_labels: Optio
         results: List of evaluation result dictionaries.
         dimension_labels: Optional mapping of dimension keys to display labels.
     """
+    # Single pass: builds the table columns (fixed columns first, score/error columns in
+    # order of first appearance) and counts successes for the summary metrics
+    columns: Dict[str, List[Any]] = {"ID": [], "Category": [], "Status": [], "Timestamp": []}
+    extra: Dict[str, Dict[int, Any]] = defaultdict(dict)
+    successful = 0
+    for row_idx, result in enumerate(results):
+        eval_result = result.get("evaluation") or _EMPTY
+        has_error = "error" in eval_result
+        successful += not has_error
+        columns["ID"].append(result.get("id", ""))
+        columns["Category"].append(result.get("category", "Unknown"))
+        columns["Status"].append("Error" if has_error else "Success")
+        columns["Timestamp"].append(result.get("timestamp", "")[:19])
+        if "evaluation" in result and not has_error:
+            scores = []
+            for key, value in eval_result.items():
+                if key != "reasoning" and isinstance(value, (int, float)):
+                    extra[key][row_idx] = float(value)
+                    scores.append(float(value))
+            if scores:
+                extra["Average Score"][row_idx] = round(sum(scores) / len(scores), 1)
+        else:
+            extra["Error"][row_idx] = eval_result.get("error", "")[:50]
+    for name, values in extra.items():
+        columns[name] = [values.get(row_idx) for row_idx in range(len(results))]
+
+    total = len(results)
     st.subheader("📊 Batch Results Summary")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Processed", len(results))
+        st.metric("Total Processed", total)
     with col2:
-        st.metric(
-            "Successful",
-            sum(1 for result in results if "error" not in result.get("evaluation", {})),
-        )
+        st.metric("Successful", successful)
     with col3:
-        st.metric(
-            "Errors",
-            sum(1 for result in results if "error" in result.get("evaluation", {})),
-        )
+        st.metric("Errors", total - successful)
     with col4:
-        success_rate = (
-            (sum(1 for result in results if "error" not in result.get("evaluation", {})) / len(results)) * 100
-            if results
-            else 0
-        )
+        success_rate = (successful / total) * 100 if total else 0
         st.metric("Success Rate", f"{success_rate:.1f}%")
     if results:
         st.subheader("📋 Detailed Results")
-        table_data = []
-        for result in results:
-            row = {
-                "ID": result.get("id", ""),
-                "Category": result.get("category", "Unknown"),
-                "Status": "Error" if "error" in result.get("evaluation", {}) else "Success",
-                "Timestamp": result.get("timestamp", "")[:19],
-            }
-            if "evaluation" in result and "error" not in result["evaluation"]:
-                eval_result = result["evaluation"]
-                scores = []
-                for key, value in eval_result.items():
-                    if key != "reasoning" and isinstance(value, (int, float)):
-                        row[key] = float(value)
-                        scores.append(float(value))
-                if scores:
-                    row["Average Score"] = round(sum(scores) / len(scores), 1)
-            else:
-                row["Error"] = result.get("evaluation", {}).get("error", "")[:50]
-            table_data.append(row)
-        results_df = pd.DataFrame(table_data)
-        st.dataframe(results_df, use_container_width=True)
-        csv = results_df.to_csv(index=False)
+        results_table = columns_to_arrow_table(columns)
+        st.dataframe(results_table, use_container_width=True)
+        csv_buffer = io.BytesIO()
+        pa_csv.write_csv(results_table, csv_buffer)
         st.download_button(
             label="📥 Download Results CSV",
-            data=csv,
-            file_name=f"batch_results_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            data=csv_buffer.getvalue(),
+            file_name=f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
         )
 
@@ -1,36 +1,94 @@
+import json
+import sys
+from importlib.resources import files
+from importlib.resources.abc import Traversable
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 import streamlit as st
 import yaml
 
+# A pathlib.Path for a regular install; a zip path when imported from an archive.
+LOCALES_PATH: Traversable = files("pain_narratives") / "locales"
+
 # Global cache to avoid Streamlit caching issues during page config
-_language_cache: Dict[str, Dict[str, Any]] = {}
+_language_cache: Dict[str, Dict[str, str]] = {}
+
+# Streamlit caches keyed by language, cleared together by clear_language_cache()
+_per_language_caches: List[Any] = []
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def language_cache(func: F) -> F:
+    """Cache ``func(language)`` with ``st.cache_resource`` until the translations are cleared.
+
+    Use it for anything derived from translated strings so that
+    :func:`clear_language_cache` invalidates it along with the translations.
+    """
+    cached = st.cache_resource(show_spinner=False)(func)
+    _per_language_caches.append(cached)
+    return cast(F, cached)
 
 
-def _load_language_data_uncached(language: str) -> Dict[str, Any]:
-    """Load the YAML file for the given language without caching."""
-    locales_path = Path(__file__).resolve().parent.parent.parent / "locales"
+def _flatten_language_data(data: Dict[str, Any]) -> Dict[str, str]:
+    """Flatten nested translations into a mapping keyed by dotted path."""
+    flat: Dict[str, str] = {}
+    stack: List[Tuple[str, Dict[str, Any]]] = [("", data or {})]
+    while stack:
+        prefix, node = stack.pop()
+        for k, v in node.items():
+            path = f"{prefix}{k}"
+            if isinstance(v, dict):
+                stack.append((f"{path}.", v))
+            else:
+                flat[sys.intern(path)] = sys.intern(str(v))
+    return flat
 
+
+def _load_language_data_uncached(language: str) -> Dict[str, str]:
+    """Load the translations for the given language without caching.
+
+    Prefers the precompiled ``<language>.json`` produced by
+    ``scripts/compile_locales.py`` and falls back to parsing the YAML source
+    when the JSON is missing or older than the YAML file.
+    """
     # Load the localization file for the given language
-    lang_file = locales_path / f"{language}.yml"
+    lang_file = LOCALES_PATH / f"{language}.yml"
 
-    if not lang_file.exists():
+    if not lang_file.is_file():
         # Final fallback to English
-        lang_file = locales_path / "en.yml"
+        language = "en"
+        lang_file = LOCALES_PATH / "en.yml"
+
+    json_file = LOCALES_PATH / f"{language}.json"
+    if json_file.is_file() and _is_up_to_date(json_file, lang_file):
+        compiled = json.loads(json_file.read_bytes())
+        return {sys.intern(k): sys.intern(v) for k, v in compiled.items()}
+
+    with lang_file.open("r", encoding="utf-8") as f:
+        return _flatten_language_data(yaml.safe_load(f))
+
 
-    with open(lang_file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+def _is_up_to_date(compiled: Traversable, source: Traversable) -> bool:
+    """Whether ``compiled`` is at least as recent as ``source``.
 
+    Files inside an archive have no mtime to compare; the archive is built
+    after ``make locales``, so its compiled JSON is trusted.
+    """
+    if isinstance(compiled, Path) and isinstance(source, Path):
+        return compiled.stat().st_mtime >= source.stat().st_mtime
+    return True
 
-# Cache with ttl to allow for language switching
-@st.cache_data(ttl=1)  # Short TTL for language switching
-def _load_language_data_cached(language: str) -> Dict[str, Any]:
-    """Load the YAML file for the given language with Streamlit caching."""
+
+# Language files are immutable at runtime, so share one copy across sessions
+@language_cache
+def _load_language_data_cached(language: str) -> Dict[str, str]:
+    """Load the translations for the given language with Streamlit caching."""
     return _load_language_data_uncached(language)
 
 
-def _load_language_data(language: str, use_cache: bool = True) -> Dict[str, Any]:
+def _load_language_data(language: str, use_cache: bool = True) -> Dict[str, str]:
     """Load language data with optional caching."""
     if not use_cache:
         # Use global cache to avoid repeated file reads during page config
@@ -42,36 +100,47 @@ def _load_language_data(language: str, use_cache: bool = True) -> Dict[str, Any]
         return _load_language_data_cached(language)
 
 
-def get_translator(language: str, use_cache: bool = True):
-    """Return a translation function for the selected language."""
-    # Clear cache when language changes (only if using cache)
-    if use_cache:
-        current_lang = st.session_state.get("current_localization_language")
-        if current_lang != language:
-            st.cache_data.clear()
-            # Also clear global cache
-            _language_cache.clear()
-            st.session_state.current_localization_language = language
-
-    lang_data = _load_language_data(language, use_cache=use_cache)
+def _build_translator(lang_data: Dict[str, str]) -> Callable[[str], str]:
+    """Build a translation function bound to already loaded language data."""
 
     def t(key: str) -> str:
-        value = lang_data
-        try:
-            for k in key.split("."):
-                value = value[k]
-            return str(value)
-        except (KeyError, TypeError):
-            # Return the key itself if translation not found
-            return key
+        # Return the key itself if translation not found
+        return lang_data.get(key, key)
 
     return t
 
 
-def clear_language_cache():
-    """Clear language cache when switching languages."""
-    st.cache_data.clear()
-    _language_cache.clear()
+@language_cache
+def _get_translator_cached(language: str) -> Callable[[str], str]:
+    """Return a translation function built once per language."""
+    return _build_translator(_load_language_data(language))
+
+
+def get_translator(language: str, use_cache: bool = True) -> Callable[[str], str]:
+    """Return a translation function for the selected language.
+
+    Translators are cached per language, so switching languages never needs
+    to invalidate anything.
+    """
+    if not use_cache:
+        return _build_translator(_load_language_data(language, use_cache=False))
+    return _get_translator_cached(language)
+
+
+def clear_language_cache(language: Optional[str] = None) -> None:
+    """Drop cached translations, for one language or all of them.
+
+    Only needed when the locale files change on disk while the app is running.
+    Everything cached with :func:`language_cache` is dropped as well.
+    """
+    if language is None:
+        for cached in _per_language_caches:
+            cached.clear()
+        _language_cache.clear()
+    else:
+        for cached in _per_language_caches:
+            cached.clear(language)
+        _language_cache.pop(language, None)
 
 
 def format_string(template: str, **kwargs) -> str:
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from functools import lru_cache, wraps
+from typing import Any, Callable, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _streamlit_runtime_exists() -> bool:
+    """Return ``True`` when running inside an active Streamlit server."""
+
+    try:
+        from streamlit import runtime
+    except ImportError:  # pragma: no cover - streamlit is a core dependency
+        return False
+    return runtime.exists()
+
+
+def resource_cache(func: F) -> F:
+    """Cache the zero-argument factory ``func`` for the lifetime of the process.
+
+    Inside a Streamlit server the factory is wrapped with
+    :func:`streamlit.cache_resource`, so heavyweight singletons (converter
+    registries, HTTP client pools, database engines) are shared by every
+    session and survive script reruns and module hot-reloads.  Outside
+    Streamlit (CLI runners, tests) a plain :func:`functools.lru_cache` is
+    used, which avoids Streamlit's "no runtime" warnings.
+
+    The backend is chosen when the wrapped function is first called rather
+    than at import time, because modules are often imported before the
+    Streamlit runtime starts.  A lock makes sure concurrent first calls (one
+    per Streamlit session thread) agree on a single backend.
+    """
+
+    cached: Callable[..., Any] | None = None
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper() -> Any:
+        nonlocal cached
+        backend = cached
+        if backend is None:
+            with lock:
+                if cached is None:
+                    if _streamlit_runtime_exists():
+                        import streamlit as st
+
+                        cached = st.cache_resource(show_spinner=False)(func)
+                    else:
+                        cached = lru_cache(maxsize=1)(func)
+                backend = cached
+        return backend()
+
+    def cache_clear() -> None:
+        nonlocal cached
+        with lock:
+            if cached is not None and hasattr(cached, "clear"):
+                cached.clear()
+            cached = None
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return cast(F, wrapper)
@@ -1,39 +1,193 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import logging
+import re
+import shutil
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO, Dict, Optional, Tuple, cast
 
-from markitdown import (
-    FileConversionException,
-    MarkItDown,
-    MissingDependencyException,
-    StreamInfo,
-    UnsupportedFormatException,
-)
+from .caching import resource_cache
 
+if TYPE_CHECKING:
+    from markitdown import DocumentConverter, MarkItDown
 
-@lru_cache(maxsize=1)
+logger = logging.getLogger(__name__)
+
+
+@resource_cache
 def _get_markitdown() -> MarkItDown:
     """Return a cached MarkItDown instance.
 
     Instantiating :class:`MarkItDown` is relatively expensive because it loads
     and registers a number of converters (and their dependencies).  Reusing a
     single instance keeps file uploads responsive without compromising
-    thread-safety—the Streamlit app runs in a single process.
+    thread-safety—the Streamlit app runs in a single process.  Under Streamlit
+    the instance lives in ``st.cache_resource`` so it also survives reruns.
+
+    MarkItDown (and the converter libraries it pulls in) is imported here
+    rather than at module level so pages that never convert a file do not pay
+    for it.
     """
 
+    from markitdown import MarkItDown
+
     return MarkItDown()
 
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+_MARKDOWN_CACHE_SIZE = 128
+_PLAIN_TEXT_SUFFIXES = frozenset({".md", ".markdown", ".txt"})
+
+# Two cache levels: each Streamlit session keeps its own uploads' Markdown
+# keyed by (upload file_id, filename) under ``_SESSION_CACHE_KEY`` so reruns
+# return without touching the stream, and this module-level LRU keyed by
+# (content digest, lower-cased suffix) serves repeats across sessions.
+_SESSION_CACHE_KEY = "_md_cache"
+_SESSION_CACHE_SIZE = 8
+_markdown_cache: OrderedDict[Tuple[bytes, str], str] = OrderedDict()
+_markdown_cache_lock = threading.Lock()
+
+# Suffixes handled by exactly one built-in MarkItDown converter (named here as
+# exported by ``markitdown.converters``), which can be called directly instead
+# of sniffing the stream and walking the converter registry.
+_DIRECT_CONVERTER_NAMES = {
+    ".docx": "DocxConverter",
+    ".pdf": "PdfConverter",
+    ".pptx": "PptxConverter",
+    ".html": "HtmlConverter",
+    ".htm": "HtmlConverter",
+}
+_LINE_BREAK = re.compile(r"\r?\n")
+_BLANK_LINE_RUN = re.compile(r"\n{3,}")
+
+
+def _buffer_stream(file: BinaryIO) -> io.BytesIO:
+    """Buffer a non-seekable stream into memory with as few copies as possible.
+
+    When the stream advertises its size (as Streamlit's ``UploadedFile`` does)
+    the payload is read straight into a preallocated buffer with
+    :meth:`~io.RawIOBase.readinto`.  Otherwise it is copied in 1 MiB chunks.
+    """
+
+    size = getattr(file, "size", None)
+    readinto = getattr(file, "readinto", None)
+    if isinstance(size, int) and size > 0 and readinto is not None:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        offset = 0
+        while offset < size:
+            count = readinto(view[offset:])
+            if not count:
+                break
+            offset += count
+        view.release()
+        del buffer[offset:]
+        return io.BytesIO(buffer)  # BytesIO cursor starts at 0
+
+    stream = io.BytesIO()
+    shutil.copyfileobj(file, stream, _COPY_CHUNK_SIZE)
+    stream.seek(0)
+    return stream
+
+
+@lru_cache(maxsize=1)
+def _direct_converters() -> Dict[str, DocumentConverter]:
+    """Map suffixes in :data:`_DIRECT_CONVERTER_NAMES` to converter instances.
+
+    MarkItDown registers these converters without arguments, so instances
+    built here behave like the ones its dispatch would pick.
+    """
+
+    from markitdown import converters
+
+    instances: Dict[str, DocumentConverter] = {}
+    for name in set(_DIRECT_CONVERTER_NAMES.values()):
+        converter_class = getattr(converters, name, None)
+        if converter_class is not None:
+            instances[name] = converter_class()
+    return {suffix: instances[name] for suffix, name in _DIRECT_CONVERTER_NAMES.items() if name in instances}
+
+
+def _normalize_markdown(text: str) -> str:
+    """Apply the whitespace normalisation MarkItDown performs after converting."""
+
+    text = "\n".join(line.rstrip() for line in _LINE_BREAK.split(text))
+    return _BLANK_LINE_RUN.sub("\n\n", text).strip()
+
+
+def _decode_text(payload: bytes) -> str:
+    """Decode a plain-text upload, guessing the encoding when it is not UTF-8."""
+
+    try:
+        return payload.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        from charset_normalizer import from_bytes
+
+        best = from_bytes(payload).best()
+        if best is not None:
+            return str(best)
+        return payload.decode("utf-8", errors="replace")
+
+
+def _content_digest(stream: BinaryIO) -> bytes:
+    """Return a BLAKE2b digest of a seekable ``stream`` positioned at its start, then rewind it.
+
+    BLAKE2b is used for speed; the digest only keys :data:`_markdown_cache`, so
+    cryptographic strength is not required.  :func:`hashlib.file_digest` hashes
+    in-memory buffers in a single update without copying them and reads files
+    into one reused buffer; other streams are hashed in 1 MiB chunks.
+    """
+
+    if hasattr(stream, "getbuffer") or hasattr(stream, "readinto"):
+        # BinaryIO does not declare readinto(); the check above guarantees it.
+        digest = hashlib.file_digest(cast(io.BufferedIOBase, stream), _new_content_hash).digest()
+    else:
+        content_hash = _new_content_hash()
+        for chunk in iter(lambda: stream.read(_COPY_CHUNK_SIZE), b""):
+            content_hash.update(chunk)
+        digest = content_hash.digest()
+    stream.seek(0)
+    return digest
+
+
+def _new_content_hash() -> hashlib.blake2b:
+    return hashlib.blake2b(digest_size=16)
+
+
+def _remember_markdown(cache_key: Tuple[bytes, str], markdown: str) -> None:
+    with _markdown_cache_lock:
+        _markdown_cache[cache_key] = markdown
+        if len(_markdown_cache) > _MARKDOWN_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+
+
+def _session_markdown_cache() -> Optional[Dict[Tuple[str, str], str]]:
+    """Return the current Streamlit session's Markdown cache, or ``None`` outside a script run."""
+
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+
+    import streamlit as st
+
+    return cast(Dict[Tuple[str, str], str], st.session_state.setdefault(_SESSION_CACHE_KEY, {}))
+
+
 def file_to_markdown(file: BinaryIO, filename: str) -> str:
     """Convert an uploaded narrative file to Markdown text.
 
     Parameters
     ----------
     file:
-        Binary file-like object positioned at the start of the uploaded data.
+        Binary file-like object with the uploaded data.  Seekable streams
+        (such as Streamlit's ``UploadedFile``) are converted in place;
+        others are buffered in memory first.
     filename:
         Original filename.  Used by MarkItDown to guess the correct converter.
 
@@ -49,22 +203,86 @@ def file_to_markdown(file: BinaryIO, filename: str) -> str:
         missing or the content is unsupported.
     """
 
-    # Reset the uploaded file pointer in case the caller has already read it.
-    file.seek(0)
-    payload = file.read()
+    # Streamlit's UploadedFile carries a file_id that is stable across reruns.
+    file_id = getattr(file, "file_id", None)
+    if not isinstance(file_id, str):
+        return _convert_to_markdown(file, filename)
+    session_cache = _session_markdown_cache()
+    if session_cache is None:
+        return _convert_to_markdown(file, filename)
 
-    if not payload:
-        return ""
+    session_key = (file_id, filename)
+    markdown = session_cache.get(session_key)
+    if markdown is None:
+        markdown = _convert_to_markdown(file, filename)
+        session_cache[session_key] = markdown
+        while len(session_cache) > _SESSION_CACHE_SIZE:
+            del session_cache[next(iter(session_cache))]
+    return markdown
 
-    stream = io.BytesIO(payload)
-    stream.seek(0)
 
-    suffix = Path(filename).suffix
+def _convert_to_markdown(file: BinaryIO, filename: str) -> str:
+    """Convert ``file`` through the module-level cache; see :func:`file_to_markdown`."""
+
+    stream: BinaryIO
+    if file.seekable():
+        # Reset the uploaded file pointer in case the caller has already read it,
+        # then peek a single byte to detect empty uploads without buffering them.
+        # Hashing and conversion below rely on the stream starting at 0.
+        file.seek(0)
+        if not file.read(1):
+            return ""
+        file.seek(0)
+        stream = file
+    else:
+        stream = _buffer_stream(file)
+        if not stream.getbuffer().nbytes:
+            return ""
+
+    path = Path(filename)
+    suffix = path.suffix
+    extension = suffix.lower()
+    if extension in _PLAIN_TEXT_SUFFIXES:
+        # Plain text and Markdown need no conversion; skip MarkItDown's dispatch
+        # but keep the whitespace normalisation it would have applied.
+        return _normalize_markdown(_decode_text(stream.read()))
+
+    cache_key = (_content_digest(stream), extension)
+    with _markdown_cache_lock:
+        cached = _markdown_cache.get(cache_key)
+        if cached is not None:
+            _markdown_cache.move_to_end(cache_key)
+            return cached
+
+    from markitdown import (
+        FileConversionException,
+        MissingDependencyException,
+        StreamInfo,
+        UnsupportedFormatException,
+    )
+
     stream_info = StreamInfo(
-        filename=Path(filename).name,
-        extension=suffix.lower() if suffix else None,
+        filename=path.name,
+        extension=extension or None,
     )
 
+    converter = _direct_converters().get(extension)
+    if converter is not None:
+        try:
+            result = converter.convert(stream, stream_info, file_extension=extension)
+        except Exception:  # noqa: BLE001 - the generic dispatch below reports the failure
+            logger.warning(
+                "Direct %s conversion of %s failed; retrying with MarkItDown dispatch",
+                type(converter).__name__,
+                path.name,
+                exc_info=True,
+            )
+            stream.seek(0)
+        else:
+            markdown = _normalize_markdown(result.markdown)
+            _remember_markdown(cache_key, markdown)
+            return markdown
+
     try:
         result = _get_markitdown().convert_stream(stream, stream_info=stream_info)
     except MissingDependencyException as exc:  # pragma: no cover - defensive
@@ -77,4 +295,6 @@ def file_to_markdown(file: BinaryIO, filename: str) -> str:
         msg = "Failed to convert the uploaded file to Markdown."
         raise RuntimeError(msg) from exc
 
-    return result.markdown.strip()
+    markdown = result.markdown.strip()
+    _remember_markdown(cache_key, markdown)
+    return markdown
@@ -1,13 +1,25 @@
 import os
-import sys
+import sqlite3
 
 import pytest
+from fixtures.openai_stub import FakeOpenAI
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
 
-# Ensure src directory is on path for all tests
-ROOT = os.path.dirname(os.path.dirname(__file__))
-SRC_PATH = os.path.join(ROOT, "src")
-if SRC_PATH not in sys.path:
-    sys.path.insert(0, SRC_PATH)
+from pain_narratives.config.settings import get_settings
+from pain_narratives.core.database import get_database_manager
+from pain_narratives.core.openai_client import OpenAIClient, get_openai_client
+from pain_narratives.db.base import SCHEMA_NAME
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run live_db tests against the configured database and cloud services",
+    )
 
 
 def pytest_configure(config):
@@ -15,10 +27,113 @@ def pytest_configure(config):
 
 
 def pytest_collection_modifyitems(config, items):
-    if os.environ.get("RUN_LIVE_DB_TESTS") == "1":
+    if config.getoption("--run-integration") or os.environ.get("RUN_LIVE_DB_TESTS") == "1":
         return
 
-    skip_live = pytest.mark.skip(reason="set RUN_LIVE_DB_TESTS=1 to run live database/cloud tests")
+    skip_live = pytest.mark.skip(
+        reason="pass --run-integration or set RUN_LIVE_DB_TESTS=1 to run live database/cloud tests"
+    )
     for item in items:
         if "live_db" in item.keywords:
             item.add_marker(skip_live)
+
+
+class _NestingSQLiteConnection(sqlite3.Connection):
+    """pysqlite connection whose nested transactions are SAVEPOINTs.
+
+    The engine's StaticPool hands every SQLAlchemy connection the same DBAPI connection, so a
+    ``Session(engine)`` opened by code under test starts its transaction inside the one held by
+    :func:`db_session`. Its commit or rollback must then only release or undo its own SAVEPOINT.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.savepoints = []
+
+    def begin(self):
+        if not self.in_transaction:
+            self.execute("BEGIN")
+            return
+        name = f"nested_{len(self.savepoints)}"
+        self.execute(f"SAVEPOINT {name}")
+        self.savepoints.append(name)
+
+    def commit(self):
+        if not self.savepoints:
+            super().commit()
+            return
+        self.execute(f"RELEASE SAVEPOINT {self.savepoints.pop()}")
+
+    def rollback(self):
+        if not self.savepoints:
+            super().rollback()
+            return
+        name = self.savepoints.pop()
+        self.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        self.execute(f"RELEASE SAVEPOINT {name}")
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine():
+    """In-memory SQLite engine with every table created once per test session."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False, "factory": _NestingSQLiteConnection},
+        poolclass=StaticPool,
+        # Checking a nested connection back in must not roll back the shared outer transaction.
+        pool_reset_on_return=None,
+        execution_options={"schema_translate_map": {SCHEMA_NAME: None}},
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.connection.dbapi_connection.begin()
+
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(sqlite_engine):
+    """Session whose commits become SAVEPOINTs inside a transaction rolled back after the test."""
+    connection = sqlite_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def fake_openai_client():
+    """OpenAIClient whose underlying client is a :class:`FakeOpenAI`."""
+    client = OpenAIClient(api_key="test-key")
+    client._client = FakeOpenAI()
+    return client
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Application settings, loaded once per test session."""
+    return get_settings()
+
+
+@pytest.fixture(scope="session")
+def db_manager():
+    """Shared DatabaseManager for live database tests."""
+    return get_database_manager()
+
+
+@pytest.fixture(scope="session")
+def openai_client():
+    """Shared OpenAIClient for live API tests."""
+    return get_openai_client()
@@ -0,0 +1 @@
+"""Reusable test doubles shared across the test suite."""
@@ -0,0 +1,32 @@
+"""Minimal stand-in for the ``openai.OpenAI`` client used in tests."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+FAKE_RESPONSE: Dict[str, Any] = {
+    "choices": [{"message": {"content": "fake reply"}}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+}
+
+
+class DummyResponse:
+    """Simple object mimicking the OpenAI response with a model_dump method."""
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+
+    def model_dump(self) -> Dict[str, Any]:
+        return self._data
+
+
+class FakeOpenAI:
+    """Implements only ``chat.completions.create`` and records each call's kwargs."""
+
+    def __init__(self, response: Dict[str, Any] = FAKE_RESPONSE) -> None:
+        self.response = DummyResponse(response)
+        self.calls: List[Dict[str, Any]] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs: Any) -> DummyResponse:
+        self.calls.append(kwargs)
+        return self.response
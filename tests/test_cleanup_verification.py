@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Verification script to test that the cleaned up codebase works correctly.
 
@@ -11,9 +10,22 @@ This script tests:
 """
 
 import logging
-import sys
 import traceback
 
+import pain_narratives.ui.app as app_module
+from pain_narratives.config.prompts import format_prompt
+from pain_narratives.config.settings import get_settings
+from pain_narratives.core.database import DatabaseManager
+from pain_narratives.core.openai_client import OpenAIClient
+from pain_narratives.ui.components.batch_processing import run_batch_evaluation
+from pain_narratives.ui.components.evaluation_logic import NarrativeEvaluator
+from pain_narratives.ui.components.prompt_manager import (
+    DEFAULT_PROMPT,
+    get_current_prompt,
+    prompt_customization_ui,
+)
+from pain_narratives.ui.components.ui_display import display_evaluation_results
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -23,28 +35,18 @@ def test_imports():
     """Test that all critical imports work."""
     logger.info("🧪 Testing imports...")
 
-    try:  # Test core imports
-        from pain_narratives.config.settings import get_settings  # noqa: F401
-        from pain_narratives.core.database import DatabaseManager  # noqa: F401
-        from pain_narratives.core.openai_client import OpenAIClient  # noqa: F401
-
-        logger.info("✅ Core imports successful")  # Test Streamlit app imports
-        from pain_narratives.ui.components.batch_processing import run_batch_evaluation  # noqa: F401
-        from pain_narratives.ui.components.evaluation_logic import NarrativeEvaluator  # noqa: F401
-        from pain_narratives.ui.components.prompt_manager import (  # noqa: F401,E501
-            DEFAULT_PROMPT,
-            get_current_prompt,
-            prompt_customization_ui,
-        )
-        from pain_narratives.ui.components.ui_display import display_evaluation_results  # noqa: F401
-
-        logger.info("✅ Streamlit component imports successful")
-
-        assert True  # All imports successful
-    except Exception as e:
-        logger.error("❌ Import failed: %s", str(e))
-        logger.error(traceback.format_exc())
-        assert False, f"Import failed: {str(e)}"
+    core = (get_settings, DatabaseManager, OpenAIClient)
+    components = (
+        run_batch_evaluation,
+        NarrativeEvaluator,
+        get_current_prompt,
+        prompt_customization_ui,
+        display_evaluation_results,
+    )
+    assert all(callable(obj) for obj in core), "Core imports are not callable"
+    logger.info("✅ Core imports successful")
+    assert all(callable(obj) for obj in components), "Streamlit component imports are not callable"
+    logger.info("✅ Streamlit component imports successful")
 
 
 def test_prompt_formatting():
@@ -52,13 +54,12 @@ def test_prompt_formatting():
     logger.info("🧪 Testing prompt formatting...")
 
     try:
-        from pain_narratives.ui.components.prompt_manager import DEFAULT_PROMPT
-
         # Test the formatting that was causing the KeyError
         test_narrative = "I have pain in my joints every morning."
 
         try:
-            formatted_prompt = DEFAULT_PROMPT.format(narrative=test_narrative)  # noqa: F841
+            formatted_prompt = format_prompt(DEFAULT_PROMPT, test_narrative)
+            assert formatted_prompt == DEFAULT_PROMPT.format(narrative=test_narrative)
             logger.info("✅ Prompt formatting successful")
 
             # Verify the JSON structure is properly escaped
@@ -83,8 +84,6 @@ def test_openai_client_init():
     logger.info("🧪 Testing OpenAI client initialization...")
 
     try:
-        from pain_narratives.core.openai_client import OpenAIClient
-
         # Test with dummy API key (won't make actual calls)
         try:
             client = OpenAIClient(api_key="test-key-for-init-only")  # noqa: F841
@@ -109,7 +108,7 @@ def test_database_manager():
     logger.info("🧪 Testing database manager...")
 
     try:
-        from pain_narratives.core.database import DatabaseManager  # noqa: F401
+        assert DatabaseManager is not None
 
         # This will test the import and basic class structure
         # Actual connection will depend on environment
@@ -127,83 +126,13 @@ def test_streamlit_app_structure():
     logger.info("🧪 Testing Streamlit app structure...")
 
     try:
-        # Import the main app module
-        import pain_narratives.ui.app as app_module
-
-        # Check for main class
-        if hasattr(app_module, "PainNarrativesApp"):
-            logger.info("✅ PainNarrativesApp class found")
-        else:
-            logger.error("❌ PainNarrativesApp class not found")
-            assert False, "PainNarrativesApp class not found"
-
-        # Check for main function
-        if hasattr(app_module, "main"):
-            logger.info("✅ main function found")
-        else:
-            logger.error("❌ main function not found")
-            assert False, "main function not found"
-
-        assert True
+        # Check for the main class and entry point in the module namespace
+        expected = {"PainNarrativesApp", "main"}
+        missing = expected - vars(app_module).keys()
+        assert not missing, f"Missing from app module: {sorted(missing)}"
+        logger.info("✅ PainNarrativesApp class and main function found")
 
     except Exception as e:
         logger.error("❌ Streamlit app structure test failed: %s", str(e))
         logger.error(traceback.format_exc())
         assert False, f"Streamlit app structure test failed: {str(e)}"
-
-
-def main() -> None:
-    """Run all verification tests."""
-    logger.info("🚀 Starting cleanup verification tests...")
-    logger.info("=" * 60)
-
-    tests = [
-        ("Import Tests", test_imports),
-        ("Prompt Formatting", test_prompt_formatting),
-        ("OpenAI Client", test_openai_client_init),
-        ("Database Manager", test_database_manager),
-        ("Streamlit App Structure", test_streamlit_app_structure),
-    ]
-
-    results = []
-    for test_name, test_func in tests:
-        logger.info(f"\n🔍 Running {test_name}...")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-            status = "✅ PASSED" if result else "❌ FAILED"
-            logger.info(f"{test_name}: {status}")
-        except Exception as e:
-            logger.error(f"❌ {test_name} crashed: {str(e)}")
-            results.append((test_name, False))
-
-    logger.info("\n" + "=" * 60)
-    logger.info("📊 VERIFICATION SUMMARY:")
-    logger.info("=" * 60)
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for test_name, result in results:
-        status = "✅ PASSED" if result else "❌ FAILED"
-        logger.info(f"{test_name:<25} {status}")
-
-    logger.info("-" * 60)
-    logger.info(f"TOTAL: {passed}/{total} tests passed")
-
-    if passed == total:
-        logger.info("🎉 ALL TESTS PASSED! Cleanup successful!")
-        logger.info("\n✨ The codebase is now clean and organized!")
-        logger.info("   • Syntax errors fixed")
-        logger.info("   • Prompt formatting issue resolved")
-        logger.info("   • Comprehensive logging added")
-        logger.info("   • Temporary files removed")
-    else:
-        logger.warning(f"⚠️  {total - passed} test(s) failed. Please review the issues above.")
-
-    return passed == total
-
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
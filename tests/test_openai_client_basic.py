@@ -1,19 +1,7 @@
-from unittest.mock import Mock, PropertyMock, patch
+from fixtures.openai_stub import FAKE_RESPONSE
 
-from pain_narratives.core.openai_client import OpenAIClient
 
-
-class DummyResponse:
-    """Simple object mimicking the OpenAI response with a model_dump method."""
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    def model_dump(self) -> dict:
-        return self._data
-
-
-def test_openai_client_basic():
+def test_openai_client_basic(fake_openai_client):
     prompt = (
         "Evaluate the pain severity described in this narrative on a scale of 0-10, "
         "where 0 is no pain and 10 is the worst pain imaginable. "
@@ -30,24 +18,11 @@ def test_openai_client_basic():
         {"role": "user", "content": narrative},
     ]
 
-    # Fake response matching the structure returned by the real API
-    fake_response_dict = {
-        "choices": [{"message": {"content": "fake reply"}}],
-        "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
-    }
-    dummy_response = DummyResponse(fake_response_dict)
-
-    with patch.object(OpenAIClient, "client", new_callable=PropertyMock) as mock_client_prop:
-        mock_client = Mock()
-        mock_client.chat.completions.create.return_value = dummy_response
-        mock_client_prop.return_value = mock_client
-
-        client = OpenAIClient(api_key="test-key")
-        response = client.create_completion(messages=messages, model=None, temperature=0.7, max_tokens=512)
-
-    assert response == fake_response_dict
-    mock_client.chat.completions.create.assert_called_once()
+    calls = fake_openai_client.client.calls
+    calls_before = len(calls)
 
+    response = fake_openai_client.create_completion(messages=messages, model=None, temperature=0.7, max_tokens=512)
 
-if __name__ == "__main__":
-    test_openai_client_basic()
+    assert response == FAKE_RESPONSE
+    assert len(calls) == calls_before + 1
+    assert calls[-1]["messages"] == messages
@@ -0,0 +1,35 @@
+import pytest
+
+from pain_narratives.config.prompts import format_prompt
+
+NARRATIVE = "My back hurts {every} day"
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Patient narrative:\n{narrative}",
+        'Respond as {{"score": <n>}}\n{narrative}\nEnd }}',
+        "{narrative!r}",
+        "[{narrative:>40}]",
+        "{narrative} and again {narrative}",
+        "No placeholder at all {{}}",
+    ],
+)
+def test_format_prompt_matches_str_format(template):
+    assert format_prompt(template, NARRATIVE) == template.format(narrative=NARRATIVE)
+
+
+@pytest.mark.parametrize(
+    ("template", "error"),
+    [
+        ("{narrative} {other}", KeyError),
+        ("{narrative", ValueError),
+        ("narrative}", ValueError),
+    ],
+)
+def test_format_prompt_raises_like_str_format(template, error):
+    with pytest.raises(error):
+        template.format(narrative=NARRATIVE)
+    with pytest.raises(error):
+        format_prompt(template, NARRATIVE)
@@ -3,13 +3,13 @@
 Quick test script to verify user management UI enhancements work correctly.
 """
 import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from pain_narratives.core.database import DatabaseManager
 
+pytestmark = pytest.mark.live_db
+
 
 def test_user_management_methods():
     """Test the new user management database methods."""
@@ -0,0 +1,79 @@
+"""Import checks for the Streamlit app's components.
+
+Also guards against heavy third-party imports creeping back into import-only paths.
+"""
+
+import importlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import verify_imports
+from verify_imports import _targets
+
+VERIFY_SCRIPT = Path(__file__).with_name("verify_imports.py")
+
+_PROBE = """
+import json, os, runpy, sys
+sys.argv = sys.argv[1:]
+# The script ends with os._exit; turn it back into SystemExit so the report below is printed.
+os._exit = sys.exit
+code = None
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+except SystemExit as exc:
+    code = exc.code
+print(json.dumps({"code": code, "loaded": [m for m in ("openai", "pandas") if m in sys.modules]}))
+"""
+
+
+def _run_verify(*args):
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(VERIFY_SCRIPT), "--no-cache", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    ("args", "unexpected"),
+    [
+        ((), {"openai", "pandas"}),
+        (("--deep",), {"openai"}),
+    ],
+)
+def test_verify_imports_does_not_load_heavy_modules(args, unexpected):
+    report = _run_verify(*args)
+
+    assert report["code"] == 0
+    assert not unexpected & set(report["loaded"])
+
+
+@pytest.mark.parametrize(("module", "attrs"), _targets(), ids=[mod for mod, _ in _targets()])
+def test_module_imports(module, attrs):
+    imported = importlib.import_module(module)
+
+    missing = [attr for attr in attrs if not hasattr(imported, attr)]
+    assert not missing, f"{module} is missing {missing}"
+
+
+def test_verify_cache_invalidated_by_package_data_change(tmp_path, monkeypatch):
+    package_dir = tmp_path / "src" / "pain_narratives"
+    (package_dir / "config").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("", encoding="utf-8")
+    prompts = package_dir / "config" / "default_prompts.yaml"
+    prompts.write_text("narrative_evaluation: {}\n", encoding="utf-8")
+    monkeypatch.setattr(verify_imports, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(verify_imports, "PACKAGE_DIR", package_dir)
+    monkeypatch.setattr(verify_imports, "CACHE_DIR", tmp_path / ".pytest_cache")
+
+    verify_imports._store_digest("deep", verify_imports._sources_digest("deep"))
+    assert verify_imports._is_cached("deep", verify_imports._sources_digest("deep"))
+
+    prompts.write_text("narrative_evaluation: [\n", encoding="utf-8")
+    assert not verify_imports._is_cached("deep", verify_imports._sources_digest("deep"))
@@ -3,10 +3,6 @@ Test script to verify the new YAML-based prompts configuration system.
 """
 
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from pain_narratives.config.prompts import (
     get_base_prompt,
@@ -0,0 +1,71 @@
+import io
+
+import pandas as pd
+
+from pain_narratives.ui.utils.data_handling import DataValidator, export_results_to_csv, generate_summary_report
+
+RESULTS = [
+    {
+        "id": 1,
+        "category": "A",
+        "narrative": "abc",
+        "evaluation": {"severity": 5, "reasoning": "ok", "tags": ["x", "y"]},
+    },
+    {"id": 2, "category": "B", "narrative": "abcd", "evaluation": {"error": "boom"}},
+    {"id": 3, "category": "A", "narrative": "abcde", "evaluation": {"severity": 7, "disability": 2}},
+]
+
+NARRATIVES = [
+    "short",
+    "This hurts a lot. My back pain is severe and I cannot sleep at night at all.",
+    "no descriptors here just a lot of words one two three four five six seven",
+    "x" * 3500,
+    "Ache!",
+]
+
+
+def test_batch_quality_check_matches_single_narrative_check():
+    df = pd.DataFrame({"narrative": NARRATIVES}, index=[10, 11, 12, 13, 14])
+
+    result = DataValidator.batch_quality_check(df)
+
+    expected = pd.DataFrame([DataValidator.check_narrative_quality(n) for n in NARRATIVES], index=df.index)
+    for column in expected.columns:
+        assert result[column].tolist() == expected[column].tolist()
+
+
+def test_batch_quality_check_without_narrative_column():
+    result = DataValidator.batch_quality_check(pd.DataFrame({"id": [1, 2]}))
+
+    assert result["quality_score"].tolist() == [0, 0]
+    assert result["issues"].tolist() == [["No narrative found"], ["No narrative found"]]
+
+
+def test_export_results_to_csv_pads_missing_columns():
+    df = pd.read_csv(io.StringIO(export_results_to_csv(RESULTS)))
+
+    assert df.columns.tolist()[:4] == ["id", "category", "narrative_length", "has_error"]
+    assert df["has_error"].tolist() == [False, True, False]
+    assert df["score_severity"].tolist()[::2] == [5, 7]
+    assert pd.isna(df["score_disability"][0])
+    assert df["list_tags"][0] == "x; y"
+    assert df["error"][1] == "boom"
+
+
+def test_export_results_to_csv_stringifies_nested_reasoning():
+    results = [
+        {"id": 1, "category": "A", "narrative": "abc", "evaluation": {"severity": 5, "reasoning": ["a", "b"]}},
+        {"id": 2, "category": "A", "narrative": "abc", "evaluation": {"severity": 6, "reasoning": ["c"]}},
+    ]
+    dict_results = [{"id": 1, "category": "A", "narrative": "abc", "evaluation": {"reasoning": {"a": "b"}}}]
+
+    assert pd.read_csv(io.StringIO(export_results_to_csv(results)))["reasoning"].tolist() == ["['a', 'b']", "['c']"]
+    assert pd.read_csv(io.StringIO(export_results_to_csv(dict_results)))["reasoning"].tolist() == ["{'a': 'b'}"]
+
+
+def test_generate_summary_report_statistics():
+    report = generate_summary_report(RESULTS)
+
+    assert "Successful: 2" in report
+    assert "Severity:\n  Mean: 6.00\n  Std:  1.41\n  Min:  5.00\n  Max:  7.00" in report
+    assert "A: 2 (66.7%)" in report
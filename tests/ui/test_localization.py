@@ -0,0 +1,67 @@
+import json
+import os
+
+import pytest
+import yaml
+
+from pain_narratives.ui.components import assessment_feedback, questionnaire_feedback
+from pain_narratives.ui.utils import localization
+from pain_narratives.ui.utils.localization import (
+    LOCALES_PATH,
+    _flatten_language_data,
+    _load_language_data_uncached,
+    clear_language_cache,
+)
+
+
+@pytest.mark.parametrize("component", [assessment_feedback, questionnaire_feedback])
+def test_clear_language_cache_drops_feedback_labels(component, monkeypatch):
+    clear_language_cache()
+    before = component._label_map_for("en")
+    assert component._label_map_for("en") is before
+
+    monkeypatch.setattr(component, "get_translator", lambda language: lambda key: f"updated {key}")
+    assert component._label_map_for("en") is before
+
+    clear_language_cache("en")
+    after = component._label_map_for("en")
+
+    assert after is not before
+    assert all(label.startswith("updated ") for label in after.values())
+    clear_language_cache()
+
+
+@pytest.fixture
+def compiled_locales(tmp_path, monkeypatch):
+    """Copy of the shipped YAML locales with freshly compiled JSON next to them."""
+    from scripts import compile_locales
+
+    for source in LOCALES_PATH.iterdir():
+        if source.name.endswith(".yml"):
+            (tmp_path / source.name).write_bytes(source.read_bytes())
+    monkeypatch.setattr(localization, "LOCALES_PATH", tmp_path)
+    monkeypatch.setattr(compile_locales, "LOCALES_PATH", tmp_path)
+    compile_locales.compile_locales()
+    return tmp_path
+
+
+@pytest.mark.parametrize("language", ["en", "es"])
+def test_compiled_locale_matches_yaml(compiled_locales, language):
+    with open(compiled_locales / f"{language}.yml", encoding="utf-8") as f:
+        from_yaml = _flatten_language_data(yaml.safe_load(f))
+    with open(compiled_locales / f"{language}.json", encoding="utf-8") as f:
+        from_json = json.load(f)
+
+    assert from_yaml
+    assert from_json == from_yaml
+    assert _load_language_data_uncached(language) == from_yaml
+
+
+def test_stale_compiled_locale_is_ignored(compiled_locales):
+    yml_path = compiled_locales / "en.yml"
+    json_path = compiled_locales / "en.json"
+    yml_path.write_text('app:\n  title: "Updated title"\n', encoding="utf-8")
+    stamp = json_path.stat().st_mtime
+    os.utime(yml_path, (stamp + 10, stamp + 10))
+
+    assert _load_language_data_uncached("en") == {"app.title": "Updated title"}
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pain_narratives.utils import caching
+
+
+def test_resource_cache_initializes_one_backend_under_concurrent_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    probes = []
+
+    def slow_runtime_probe() -> bool:
+        probes.append(threading.get_ident())
+        time.sleep(0.05)
+        return False
+
+    monkeypatch.setattr(caching, "_streamlit_runtime_exists", slow_runtime_probe)
+
+    @caching.resource_cache
+    def factory() -> object:
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: factory(), range(8)))
+
+    assert len(probes) == 1
+    assert all(result is results[0] for result in results)
+
+    factory.cache_clear()  # type: ignore[attr-defined]
+    assert factory() is not results[0]
@@ -46,3 +46,96 @@ def _decode(data: str) -> io.BytesIO:
 def test_file_to_markdown(payload: io.BytesIO, filename: str, expected: str) -> None:
     result = file_to_markdown(payload, filename)
     assert expected in result
+
+
+def test_plain_text_fast_path_matches_markitdown() -> None:
+    from markitdown import MarkItDown, StreamInfo
+
+    payload = b"Line one   \r\nLine two\r\n\r\n\r\n\r\nLine three"
+    expected = MarkItDown().convert_stream(io.BytesIO(payload), stream_info=StreamInfo(extension=".txt"))
+
+    result = file_to_markdown(io.BytesIO(payload), "narrative.txt")
+
+    assert result == expected.markdown.strip()
+    assert result == "Line one\nLine two\n\nLine three"
+
+
+def test_file_to_markdown_reuses_cached_conversion(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pain_narratives.utils import file_utils
+
+    calls = []
+    original = file_utils._get_markitdown
+
+    def counting_markitdown():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(file_utils, "_markdown_cache", type(file_utils._markdown_cache)())
+    monkeypatch.setattr(file_utils, "_get_markitdown", counting_markitdown)
+    monkeypatch.setattr(file_utils, "_direct_converters", dict)
+
+    first = file_to_markdown(_decode(_DOCX_BASE64), "first.docx")
+    second = file_to_markdown(_decode(_DOCX_BASE64), "second.docx")
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_direct_converter_matches_markitdown_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pain_narratives.utils import file_utils
+
+    converter = file_utils._direct_converters()[".docx"]
+    calls = []
+
+    class SpyConverter:
+        def convert(self, *args, **kwargs):
+            calls.append(kwargs)
+            return converter.convert(*args, **kwargs)
+
+    monkeypatch.setattr(file_utils, "_markdown_cache", type(file_utils._markdown_cache)())
+    monkeypatch.setattr(file_utils, "_direct_converters", lambda: {".docx": SpyConverter()})
+    direct = file_to_markdown(_decode(_DOCX_BASE64), "sample.docx")
+
+    monkeypatch.setattr(file_utils, "_markdown_cache", type(file_utils._markdown_cache)())
+    monkeypatch.setattr(file_utils, "_direct_converters", dict)
+    dispatched = file_to_markdown(_decode(_DOCX_BASE64), "sample.docx")
+
+    assert calls == [{"file_extension": ".docx"}]
+    assert direct == dispatched
+
+
+def test_direct_converter_failure_falls_back_to_dispatch(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    from pain_narratives.utils import file_utils
+
+    class BrokenConverter:
+        def convert(self, *args, **kwargs):
+            raise ValueError("broken")
+
+    monkeypatch.setattr(file_utils, "_markdown_cache", type(file_utils._markdown_cache)())
+    monkeypatch.setattr(file_utils, "_direct_converters", lambda: {".docx": BrokenConverter()})
+
+    with caplog.at_level("WARNING", logger=file_utils.__name__):
+        result = file_to_markdown(_decode(_DOCX_BASE64), "sample.docx")
+
+    assert "Hello DOCX narrative" in result
+    assert "BrokenConverter" in caplog.text
+
+
+def test_file_to_markdown_serves_session_cache_by_file_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pain_narratives.utils import file_utils
+
+    session_cache: dict = {}
+    monkeypatch.setattr(file_utils, "_session_markdown_cache", lambda: session_cache)
+
+    upload = io.BytesIO(b"Session narrative")
+    upload.file_id = "upload-1"  # type: ignore[attr-defined]
+    assert file_to_markdown(upload, "session.txt") == "Session narrative"
+
+    def fail_conversion(file, filename):
+        raise AssertionError("conversion should be served from the session cache")
+
+    monkeypatch.setattr(file_utils, "_convert_to_markdown", fail_conversion)
+    assert file_to_markdown(upload, "session.txt") == "Session narrative"
+    assert session_cache == {("upload-1", "session.txt"): "Session narrative"}